@@ -1,9 +1,21 @@
+import io
 import os
+import shutil
+import stat
 import subprocess
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from typing import Dict
 from src.parser import ParsedCommand
 
+# Maximum number of bytes handed to a single os.sendfile call
+_SENDFILE_CHUNK_SIZE = 1024 * 1024
+
+
+def _stdout_is_process_stdout() -> bool:
+    """Check whether sys.stdout still refers to the process's real stdout."""
+    return sys.stdout is sys.__stdout__
+
 
 class Command(ABC):
     """Abstract base class defining the command execution interface."""
@@ -36,13 +48,43 @@ class CatCommand(Command):
         """
         try:
             filepath: str = command.args[0]
-            with open(filepath, 'r') as f:
-                print(f.read(), end='')
+            if _stdout_is_process_stdout():
+                self._send_to_stdout(filepath)
+            else:
+                with open(filepath, 'r') as f:
+                    # Copy in fixed-size chunks instead of reading the whole file
+                    shutil.copyfileobj(f, sys.stdout)
             return 0
         except Exception as e:
             print(f"Error `cat`: {e}")
             return 1
 
+    def _send_to_stdout(self, filepath: str) -> None:
+        """
+        Copy file bytes to the stdout file descriptor.
+
+        Uses os.sendfile so the data never passes through Python buffers;
+        falls back to a buffered copy for non-regular files (FIFOs,
+        devices) and where sendfile is unavailable or unsupported for the
+        output descriptor.
+        """
+        sys.stdout.flush()
+        with open(filepath, 'rb') as f:
+            offset: int = 0
+            # st_size is not reliable (0 for /proc files), so send until EOF
+            if stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+                try:
+                    out_fd: int = sys.stdout.fileno()
+                    while True:
+                        sent = os.sendfile(out_fd, f.fileno(), offset, _SENDFILE_CHUNK_SIZE)
+                        if sent == 0:
+                            return
+                        offset += sent
+                except (AttributeError, OSError):
+                    f.seek(offset)
+            shutil.copyfileobj(f, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+
 
 class EchoCommand(Command):
     """Implementation of 'echo' command to print arguments."""
@@ -67,13 +109,17 @@ class WcCommand(Command):
         try:
             # Open file
             filepath: str = command.args[0]
-            with open(filepath, 'r') as f:
-                content = f.read()
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            # Decode like open(filepath, 'r') so wc and cat agree on
+            # encoding (locale default) and newline translation
+            content = io.TextIOWrapper(io.BytesIO(raw)).read()
 
             # Calculate metrics
-            lines: int = len(content.split('\n'))
+            # Count newlines without materializing a list of lines
+            lines: int = content.count('\n') + 1
             words: int = len(content.split())
-            bytes: int = os.path.getsize(filepath)
+            bytes: int = len(raw)
 
             print(f"{lines} {words} {bytes}")
             return 0
@@ -114,13 +160,23 @@ class DefaultCommand(Command):
         - Command not found errors
         - Non-zero exit codes from child processes
         - Output capturing and display
+
+        When stdout is the process's own stdout, the child writes to it
+        directly instead of having its output captured and re-printed.
         """
         try:
-            result = subprocess.run(
-                [command.command_name] + command.args,
-                check=True, capture_output=True, text=True
-            )
-            print(result.stdout)
+            if _stdout_is_process_stdout():
+                sys.stdout.flush()
+                result = subprocess.run(
+                    [command.command_name, *command.args],
+                    check=True, stderr=subprocess.PIPE, text=True
+                )
+            else:
+                result = subprocess.run(
+                    [command.command_name, *command.args],
+                    check=True, capture_output=True, text=True
+                )
+                print(result.stdout, end='')
             return result.returncode
         except FileNotFoundError:
             print(f"{command.command_name}: command not found")
@@ -133,13 +189,15 @@ class DefaultCommand(Command):
 class CommandRegistry:
     """Registry mapping command names to their implementations."""
 
-    _commands: Dict[str, Type[Command]] = {
-        'cat': CatCommand,
-        'echo': EchoCommand,
-        'wc': WcCommand,
-        'pwd': PwdCommand,
-        'exit': ExitCommand
+    # Commands are stateless, so a single shared instance of each is reused
+    _commands: Dict[str, Command] = {
+        'cat': CatCommand(),
+        'echo': EchoCommand(),
+        'wc': WcCommand(),
+        'pwd': PwdCommand(),
+        'exit': ExitCommand()
     }
+    _default: Command = DefaultCommand()
 
     def get_command(self, name: str) -> Command:
         """
@@ -149,4 +207,4 @@ class CommandRegistry:
             Command: Concrete command implementation
                      DefaultCommand if name not registered
         """
-        return self._commands.get(name, DefaultCommand)()
+        return self._commands.get(name, self._default)
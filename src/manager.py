@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 from src.commands import ExitCommandException
 from src.executor import Executor
 from src.parser import Parser
@@ -7,8 +7,13 @@ from src.parser import Parser
 class CLIManager:
     """Main controller class for CLI session management."""
 
-    def __init__(self):
-        """Initialize CLI components and state."""
+    def __init__(self, input_fn: Callable[[str], str] = input):
+        """Initialize CLI components and state.
+
+        Args:
+            input_fn: Function used to read a line given a prompt
+        """
+        self.input_fn = input_fn  # Line reader (builtin input by default)
         self.parser = Parser()		# Command input parser
         self.executor = Executor()  # Command execution handler
         self.is_running = False		# Session activity flag
@@ -43,7 +48,7 @@ class CLIManager:
             Optional[str]: Cleaned input string or None for EOF
         """
         try:
-            return input("> ").strip()
+            return self.input_fn("> ").strip()
         except EOFError:
             self._stop()
             return None
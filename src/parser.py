@@ -1,27 +1,35 @@
+import re
 import shlex
-from typing import List
+from dataclasses import dataclass
+from typing import List, Tuple
 
+# Characters that require shlex to tokenize the input correctly
+_QUOTE_CHARS = frozenset('\'"\\')
 
+# Whitespace that shlex treats as a token separator
+_SHLEX_WHITESPACE_RE = re.compile(r'[ \t\r\n]+')
+
+
+@dataclass(frozen=True)
 class ParsedCommand:
     """Class representing a parsed command.
 
     Attributes:
         command_name (str): The name of the command.
-        args (List[str]): List of command arguments.
+        args (Tuple[str, ...]): Command arguments.
     """
-    def __init__(self, command_name: str, args: List[str]):
-        self.command_name = command_name
-        self.args = args
+    command_name: str
+    args: Tuple[str, ...]
 
 
+@dataclass(frozen=True)
 class ParsedInput:
     """Class representing parsed user input.
 
     Attributes:
-        commands (List[ParsedCommand]): List of parsed commands.
+        commands (Tuple[ParsedCommand, ...]): Parsed commands.
     """
-    def __init__(self, commands: List[ParsedCommand]):
-        self.commands = commands
+    commands: Tuple[ParsedCommand, ...]
 
 
 class ParseError(Exception):
@@ -35,7 +43,8 @@ class Parser:
     def _parse_command(self, input: str) -> ParsedCommand:
         """Internal method to parse a string into a command and arguments.
 
-        Uses shlex.split to properly handle quotes and spaces.
+        Uses shlex.split to properly handle quotes and spaces; input
+        without quotes or escapes is split on shlex's whitespace directly.
 
         Args:
             input (str): User input string (e.g., "cmd 'arg 1' arg2").
@@ -44,14 +53,17 @@ class Parser:
             ParsedCommand: Object containing the command and its arguments.
         """
         # Split input while respecting quotes and escaping
-        args: List[str] = shlex.split(input)
+        if _QUOTE_CHARS.isdisjoint(input):
+            args: List[str] = [t for t in _SHLEX_WHITESPACE_RE.split(input) if t]
+        else:
+            args = shlex.split(input)
 
         if len(args) == 0:
             raise ParseError("Empty command")
 
         # Extract command name (first element)
-        command_name: str = args.pop(0)
-        return ParsedCommand(command_name=command_name, args=args)
+        command_name: str = args[0]
+        return ParsedCommand(command_name=command_name, args=tuple(args[1:]))
 
     def parse(self, input: str) -> ParsedInput:
         """Main method to parse user input.
@@ -65,4 +77,4 @@ class Parser:
         Note:
             Current implementation assumes single-command input.
         """
-        return ParsedInput(commands=[self._parse_command(input=input)])
+        return ParsedInput(commands=(self._parse_command(input=input),))
@@ -1,78 +1,98 @@
 import unittest
 import os
+import pathlib
 import tempfile
 import io
-from unittest.mock import patch
+import sys
 from src.commands import (
     EchoCommand, CatCommand, WcCommand, PwdCommand,
     ExitCommand, DefaultCommand, ExitCommandException
 )
 from src.parser import ParsedCommand
 
+_FIXTURE_BYTES = b"line1\nline2\nline3"
+_FIXTURE_PATH = None
+
+_ECHO = ParsedCommand("echo", ("test",))
+_PWD = ParsedCommand("pwd", ())
+_EXIT = ParsedCommand("exit", ())
+
+
+def setUpModule():
+    global _FIXTURE_PATH
+    fd, _FIXTURE_PATH = tempfile.mkstemp(prefix='basic_cli_fixture_', suffix='.txt')
+    os.close(fd)
+    pathlib.Path(_FIXTURE_PATH).write_bytes(_FIXTURE_BYTES)
+
+
+def tearDownModule():
+    os.unlink(_FIXTURE_PATH)
+
 
 class TestCommands(unittest.TestCase):
-    def setUp(self):
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.write(b"line1\nline2\nline3")
-        self.temp_file.close()
+    held_output = io.StringIO()
 
-    def tearDown(self):
-        os.unlink(self.temp_file.name)
+    def setUp(self):
+        self.held_output.seek(0)
+        self.held_output.truncate()
+        self.addCleanup(setattr, sys, 'stdout', sys.stdout)
+        sys.stdout = self.held_output
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_echo_command(self, mock_stdout):
+    def test_echo_command(self):
         cmd = EchoCommand()
-        exit_code = cmd.execute(ParsedCommand("echo", ["test"]))
+        exit_code = cmd.execute(_ECHO)
         self.assertEqual(exit_code, 0)
-        self.assertEqual(mock_stdout.getvalue().strip(), "test")
+        self.assertEqual(self.held_output.getvalue().strip(), "test")
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_cat_command(self, mock_stdout):
+    def test_cat_command(self):
         cmd = CatCommand()
-        exit_code = cmd.execute(ParsedCommand("cat", [self.temp_file.name]))
+        exit_code = cmd.execute(ParsedCommand("cat", (_FIXTURE_PATH,)))
         self.assertEqual(exit_code, 0)
-        self.assertIn("line1", mock_stdout.getvalue())
-        self.assertIn("line2", mock_stdout.getvalue())
-        self.assertIn("line3", mock_stdout.getvalue())
-        self.assertNotIn("line4", mock_stdout.getvalue())
+        self.assertEqual(self.held_output.getvalue(), _FIXTURE_BYTES.decode())
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_wc_command(self, mock_stdout):
+    def test_wc_command(self):
         cmd = WcCommand()
-        exit_code = cmd.execute(ParsedCommand("wc", [self.temp_file.name]))
+        exit_code = cmd.execute(ParsedCommand("wc", (_FIXTURE_PATH,)))
         self.assertEqual(exit_code, 0)
         expected_lines = 3
         expected_words = 3
-        expected_bytes = 3 * 5 + 2
+        expected_bytes = len(_FIXTURE_BYTES)
         expected = f"{expected_lines} {expected_words} {expected_bytes}"
-        self.assertEqual(mock_stdout.getvalue().strip(), expected)
+        self.assertEqual(self.held_output.getvalue().strip(), expected)
+
+    def test_wc_command_translates_newlines(self):
+        fd, path = tempfile.mkstemp(prefix='basic_cli_wc_', suffix='.txt')
+        os.close(fd)
+        self.addCleanup(os.unlink, path)
+        pathlib.Path(path).write_bytes(b"a\rb\r\nc")
+        cmd = WcCommand()
+        exit_code = cmd.execute(ParsedCommand("wc", (path,)))
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(self.held_output.getvalue().strip(), "3 3 6")
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_pwd_command(self, mock_stdout):
+    def test_pwd_command(self):
         cmd = PwdCommand()
-        exit_code = cmd.execute(ParsedCommand("pwd", []))
+        exit_code = cmd.execute(_PWD)
         self.assertEqual(exit_code, 0)
-        self.assertEqual(mock_stdout.getvalue().strip(), os.getcwd())
+        self.assertEqual(self.held_output.getvalue().strip(), os.getcwd())
 
     def test_exit_command(self):
         cmd = ExitCommand()
         with self.assertRaises(ExitCommandException):
-            cmd.execute(ParsedCommand("exit", []))
+            cmd.execute(_EXIT)
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_default_command(self, mock_stdout):
+    def test_default_command(self):
         cmd = DefaultCommand()
         exit_code = cmd.execute(ParsedCommand(
-            "head", [self.temp_file.name, "-n", "1"]
+            "head", (_FIXTURE_PATH, "-n", "1")
         ))
         self.assertEqual(exit_code, 0)
-        self.assertEqual(mock_stdout.getvalue().strip(), "line1")
+        self.assertEqual(self.held_output.getvalue().strip(), "line1")
 
-    @patch('sys.stdout', new_callable=io.StringIO)
-    def test_other_default_command(self, mock_stdout):
+    def test_other_default_command(self):
         cmd = DefaultCommand()
         exit_code = cmd.execute(ParsedCommand(
-            "tail", [self.temp_file.name, "-n", "1"]
+            "tail", (_FIXTURE_PATH, "-n", "1")
         ))
         self.assertEqual(exit_code, 0)
-        self.assertEqual(mock_stdout.getvalue().strip(), "line3")
+        self.assertEqual(self.held_output.getvalue().strip(), "line3")
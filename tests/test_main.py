@@ -0,0 +1,94 @@
+import unittest
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import threading
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestMainStdout(unittest.TestCase):
+    """Run the CLI as a process so commands see the real stdout."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.fixture_path = os.path.join(self.tmp_dir.name, 'fixture.txt')
+        pathlib.Path(self.fixture_path).write_bytes(b"line1\nline2\nline3\n")
+
+    def _run(self, args, stdin=b''):
+        output_path = os.path.join(self.tmp_dir.name, 'output.txt')
+        # Keep stdout block-buffered so output ordering is actually tested
+        env = {k: v for k, v in os.environ.items() if k != 'PYTHONUNBUFFERED'}
+        with open(output_path, 'wb') as out:
+            subprocess.run(
+                [sys.executable] + args, input=stdin, env=env,
+                stdout=out, cwd=_REPO_ROOT, check=True, timeout=30
+            )
+        return pathlib.Path(output_path).read_text()
+
+    def _run_session(self, lines):
+        return self._run(['-m', 'src.main'], ''.join(line + '\n' for line in lines).encode())
+
+    @staticmethod
+    def _write_fifo(path, data):
+        try:
+            pathlib.Path(path).write_bytes(data)
+        except BrokenPipeError:
+            pass  # Reader went away; the test reports the failure
+
+    @staticmethod
+    def _stop_fifo_writer(writer, path):
+        if writer.is_alive():
+            # Unblock a writer still waiting in open() for a reader
+            os.close(os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+        writer.join(timeout=5)
+
+    def test_default_command_writes_to_stdout(self):
+        output = self._run_session([
+            "echo before", f"head -n 1 {self.fixture_path}", "echo after", "exit"
+        ])
+        self.assertEqual(output.splitlines(), [
+            "> before", "Exit code: 0",
+            "> line1", "Exit code: 0",
+            "> after", "Exit code: 0",
+            "> `exit` received, closing...", ""
+        ])
+
+    def test_default_command_flushes_pending_output(self):
+        output = self._run(['-c', (
+            "from src.commands import DefaultCommand\n"
+            "from src.parser import ParsedCommand\n"
+            "print('before')\n"
+            f"DefaultCommand().execute(ParsedCommand('head', ('-n', '1', {self.fixture_path!r})))\n"
+        )])
+        self.assertEqual(output, "before\nline1\n")
+
+    def test_cat_regular_file(self):
+        output = self._run_session([f"cat {self.fixture_path}", "exit"])
+        self.assertEqual(output.splitlines(), [
+            "> line1", "line2", "line3", "Exit code: 0",
+            "> `exit` received, closing...", ""
+        ])
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "requires named pipes")
+    def test_cat_fifo(self):
+        fifo_path = os.path.join(self.tmp_dir.name, 'fifo')
+        os.mkfifo(fifo_path)
+        # Opening the FIFO blocks until the CLI opens it for reading
+        writer = threading.Thread(target=self._write_fifo, args=(fifo_path, b"from fifo\n"), daemon=True)
+        writer.start()
+        self.addCleanup(self._stop_fifo_writer, writer, fifo_path)
+        output = self._run_session([f"cat {fifo_path}", "exit"])
+        self.assertEqual(output.splitlines(), [
+            "> from fifo", "Exit code: 0",
+            "> `exit` received, closing...", ""
+        ])
+
+    @unittest.skipUnless(os.path.exists('/proc/version'), "requires procfs")
+    def test_cat_zero_size_proc_file(self):
+        expected = pathlib.Path('/proc/version').read_text()
+        output = self._run_session(["cat /proc/version", "exit"])
+        self.assertEqual(output, f"> {expected}Exit code: 0\n> `exit` received, closing...\n\n")
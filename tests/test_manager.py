@@ -1,41 +1,57 @@
 import unittest
-from unittest.mock import patch
+from collections import deque
 from io import StringIO
 import sys
 from src.manager import CLIManager
 
 
+def _scripted_input(lines):
+    queue = deque(lines)
+
+    def read_line(prompt=''):
+        # Behave like input() at end of stream so the session stops
+        if not queue:
+            raise EOFError
+        return queue.popleft()
+    return read_line
+
+
 class TestCLIManager(unittest.TestCase):
+    held_output = StringIO()
+
     def setUp(self):
-        self.held_output = StringIO()
+        self.held_output.seek(0)
+        self.held_output.truncate()
+        self.addCleanup(setattr, sys, 'stdout', sys.stdout)
         sys.stdout = self.held_output
 
-    def tearDown(self):
-        sys.stdout = sys.__stdout__
+    def test_session_flow(self):
+        manager = CLIManager(input_fn=_scripted_input(["echo test", "exit"]))
+        manager.start()
+        output = self.held_output.getvalue()
+        self.assertEqual(output.splitlines(), [
+            "test", "Exit code: 0", "`exit` received, closing...", ""
+        ])
 
-    @patch('builtins.input')
-    def test_session_flow(self, mock_input):
-        mock_input.side_effect = ["echo test", "exit"]
-        manager = CLIManager()
+    def test_exit_command(self):
+        manager = CLIManager(input_fn=_scripted_input(["exit"]))
         manager.start()
         output = self.held_output.getvalue()
-        self.assertIn("test", output)
-        self.assertIn("Exit code: 0", output)
-        self.assertIn("`exit` received, closing...", output)
-
-    @patch('builtins.input')
-    def test_exit_command(self, mock_input):
-        mock_input.side_effect = ["exit"]
-        manager = CLIManager()
+        self.assertEqual(output.splitlines(), ["`exit` received, closing...", ""])
+
+    def test_unknown_command(self):
+        manager = CLIManager(input_fn=_scripted_input(["unknown_command", "exit"]))
         manager.start()
         output = self.held_output.getvalue()
-        self.assertIn("`exit` received, closing...", output)
+        self.assertEqual(output.splitlines(), [
+            "unknown_command: command not found", "Exit code: 1",
+            "`exit` received, closing...", ""
+        ])
 
-    @patch('builtins.input')
-    def test_unknown_command(self, mock_input):
-        mock_input.side_effect = ["unknown_command", "exit"]
-        manager = CLIManager()
+    def test_end_of_input(self):
+        manager = CLIManager(input_fn=_scripted_input(["echo test"]))
         manager.start()
         output = self.held_output.getvalue()
-        self.assertIn("unknown_command: command not found", output)
-        self.assertIn("Exit code: 1", output)
+        self.assertEqual(output.splitlines(), [
+            "test", "Exit code: 0", "", "Session terminated."
+        ])
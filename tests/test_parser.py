@@ -1,47 +1,61 @@
 import unittest
+from dataclasses import FrozenInstanceError
 from src.parser import ParseError, Parser
 
 
 class TestParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = Parser()
+
     def test_parse_simple_command(self):
-        parser = Parser()
-        result = parser.parse("echo hello world")
+        result = self.parser.parse("echo hello world")
         self.assertEqual(len(result.commands), 1)
         self.assertEqual(result.commands[0].command_name, "echo")
-        self.assertEqual(result.commands[0].args, ["hello", "world"])
+        self.assertEqual(result.commands[0].args, ("hello", "world"))
 
     def test_parse_empty_input(self):
-        parser = Parser()
         with self.assertRaises(expected_exception=ParseError):
-            parser.parse("")
+            self.parser.parse("")
 
     def test_parse_quoted_arguments(self):
-        parser = Parser()
-        result = parser.parse("echo 'hello world'")
-        self.assertEqual(result.commands[0].args, ["hello world"])
+        result = self.parser.parse("echo 'hello world'")
+        self.assertEqual(result.commands[0].args, ("hello world",))
 
     def test_parse_double_quoted_arguments(self):
-        parser = Parser()
-        result = parser.parse('echo "hello world"')
-        self.assertEqual(result.commands[0].args, ["hello world"])
+        result = self.parser.parse('echo "hello world"')
+        self.assertEqual(result.commands[0].args, ("hello world",))
 
     def test_parse_exit_command(self):
-        parser = Parser()
-        result = parser.parse('exit')
+        result = self.parser.parse('exit')
         self.assertEqual(len(result.commands), 1)
         self.assertEqual(result.commands[0].command_name, "exit")
-        self.assertEqual(result.commands[0].args, [])
+        self.assertEqual(result.commands[0].args, ())
 
     def test_parse_wc_command(self):
-        parser = Parser()
-        result = parser.parse('wc abc.txt')
+        result = self.parser.parse('wc abc.txt')
         self.assertEqual(len(result.commands), 1)
         self.assertEqual(result.commands[0].command_name, "wc")
-        self.assertEqual(result.commands[0].args, ["abc.txt"])
+        self.assertEqual(result.commands[0].args, ("abc.txt",))
 
     def test_parse_unknown_command(self):
-        parser = Parser()
-        result = parser.parse('unknown_command with unknown args')
+        result = self.parser.parse('unknown_command with unknown args')
         self.assertEqual(len(result.commands), 1)
         self.assertEqual(result.commands[0].command_name, "unknown_command")
-        self.assertEqual(result.commands[0].args, ["with", "unknown", "args"])
+        self.assertEqual(result.commands[0].args, ("with", "unknown", "args"))
+
+    def test_parse_escaped_space(self):
+        result = self.parser.parse('echo hello\\ world')
+        self.assertEqual(result.commands[0].args, ("hello world",))
+
+    def test_parse_non_breaking_space(self):
+        result = self.parser.parse('echo hello\xa0world\u2003!')
+        self.assertEqual(result.commands[0].args, ("hello\xa0world\u2003!",))
+
+    def test_parsed_command_is_immutable(self):
+        result = self.parser.parse("echo hello")
+        with self.assertRaises(FrozenInstanceError):
+            result.commands[0].command_name = "cat"
+        with self.assertRaises(AttributeError):
+            result.commands[0].args.append("world")
+        self.assertEqual(hash(result), hash(self.parser.parse("echo hello")))